@@ -7,8 +7,11 @@ and case-insensitive comparisons when PyICU is not available.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import unicodedata
+from collections.abc import Callable, Sequence
 from enum import Enum
+from functools import cache, lru_cache
+from operator import methodcaller
 
 # Try to import PyICU for advanced collation support
 try:
@@ -40,7 +43,7 @@ class Collation(str, Enum):
     """Simple Python-based collation (no PyICU required).
 
     - case_sensitive=True: Byte-for-byte comparison
-    - case_sensitive=False: Python's str.lower() comparison
+    - case_sensitive=False: Python's str.casefold() comparison
     """
 
     UNICODE = "unicode"
@@ -98,11 +101,7 @@ def get_collation_function(
             return _case_insensitive_contains
 
     elif collation in (Collation.UNICODE, Collation.LOCALE):
-        if not HAS_PYICU:
-            raise CollationError(
-                f"Collation '{collation}' requires PyICU to be installed. "
-                "Install with: pip install 'icalendar-searcher[collation]'"
-            )
+        _require_icu_backend(collation)
 
         if collation == Collation.LOCALE:
             if not locale:
@@ -116,6 +115,46 @@ def get_collation_function(
         raise CollationError(f"Unknown collation: {collation}")
 
 
+def contains_batch(
+    needle: str,
+    haystacks: Sequence[str],
+    collation: Collation = Collation.SIMPLE,
+    case_sensitive: bool = True,
+    locale: str | None = None,
+) -> list[bool]:
+    """Substring match of one needle against many haystacks.
+
+    Equivalent to calling the function from :func:`get_collation_function`
+    once for every haystack, but the collation is resolved and the needle
+    is prepared only once for the whole batch.
+
+    Args:
+        needle: The string to search for
+        haystacks: The strings to search in
+        collation: The collation strategy to use
+        case_sensitive: Whether comparison should be case-sensitive
+        locale: Locale string (e.g., "de_DE", "en_US") for LOCALE collation
+
+    Returns:
+        A list with one bool per haystack, in the same order.
+
+    Raises:
+        CollationError: If PyICU is required but not available, or if
+                       invalid parameters are provided.
+
+    Examples:
+        >>> contains_batch("test", ["A TEST", "nothing"], case_sensitive=False)
+        [True, False]
+    """
+    if collation == Collation.SIMPLE:
+        if case_sensitive:
+            return [needle in haystack for haystack in haystacks]
+        needle = needle.casefold()
+        return [needle in haystack.casefold() for haystack in haystacks]
+    match_fn = get_collation_function(collation, case_sensitive, locale)
+    return [match_fn(needle, haystack) for haystack in haystacks]
+
+
 def get_sort_key_function(
     collation: Collation = Collation.SIMPLE,
     case_sensitive: bool = True,
@@ -143,16 +182,12 @@ def get_sort_key_function(
     """
     if collation == Collation.SIMPLE:
         if case_sensitive:
-            return lambda s: s.encode("utf-8")
+            return _binary_sort_key
         else:
-            return lambda s: s.lower().encode("utf-8")
+            return _case_insensitive_sort_key
 
     elif collation in (Collation.UNICODE, Collation.LOCALE):
-        if not HAS_PYICU:
-            raise CollationError(
-                f"Collation '{collation}' requires PyICU to be installed. "
-                "Install with: pip install 'icalendar-searcher[collation]'"
-            )
+        _require_icu_backend(collation)
 
         if collation == Collation.LOCALE:
             if not locale:
@@ -171,6 +206,29 @@ def get_sort_key_function(
 # ============================================================================
 
 
+def _require_icu_backend(collation: Collation) -> None:
+    """Raise CollationError if no backend for UNICODE/LOCALE collation is available."""
+    if not HAS_PYICU:
+        raise CollationError(
+            f"Collation '{collation}' requires PyICU to be installed. "
+            "Install with: pip install 'icalendar-searcher[collation]'"
+        )
+
+
+## Sort key for binary collation.  methodcaller runs in C, so the sort
+## does not pay for an extra Python frame per element
+_binary_sort_key = methodcaller("encode", "utf-8")
+
+
+def _case_insensitive_sort_key(s: str) -> bytes:
+    """Sort key for case-insensitive SIMPLE collation.
+
+    Case-folded like the case-insensitive matching, so that values
+    matching each other also sort as equal.
+    """
+    return s.casefold().encode("utf-8")
+
+
 def _binary_contains(needle: str, haystack: str) -> bool:
     """Binary (case-sensitive) substring match."""
     return needle in haystack
@@ -178,7 +236,39 @@ def _binary_contains(needle: str, haystack: str) -> bool:
 
 def _case_insensitive_contains(needle: str, haystack: str) -> bool:
     """Case-insensitive substring match."""
-    return needle.lower() in haystack.lower()
+    return needle.casefold() in haystack.casefold()
+
+
+def _normalize_for_search(s: str, case_sensitive: bool) -> str:
+    """Decompose a string so canonically equivalent text compares equal.
+
+    Case-insensitive searches also fold compatibility characters and case.
+    """
+    if case_sensitive:
+        return unicodedata.normalize("NFD", s)
+    return unicodedata.normalize("NFKD", s).casefold()
+
+
+## The needle is the same for every component checked by a filter,
+## so its normalized form is worth caching
+_normalize_needle = lru_cache(maxsize=256)(_normalize_for_search)
+
+
+def _normalized_contains(needle: str, haystack: str) -> bool:
+    """Substring match on decomposed strings, respecting grapheme clusters.
+
+    A match must not end in the middle of a cluster - "cafe" is not
+    found in "café", as the accent decomposes to a combining mark
+    following the matched "e".
+    """
+    n = len(needle)
+    i = haystack.find(needle)
+    while i != -1:
+        end = i + n
+        if end == len(haystack) or not unicodedata.combining(haystack[end]):
+            return True
+        i = haystack.find(needle, i + 1)
+    return False
 
 
 def _get_icu_contains(locale: str | None, case_sensitive: bool) -> Callable[[str, str], bool]:
@@ -186,44 +276,57 @@ def _get_icu_contains(locale: str | None, case_sensitive: bool) -> Callable[[str
 
     Note: This is a simplified implementation. PyICU doesn't expose ICU's
     StringSearch API which would be needed for proper substring matching with
-    collation. For now, we use Python's built-in matching.
+    collation.  Instead both strings are brought to a decomposed normal form
+    (case folded for case-insensitive searches), so precomposed and
+    combining-mark spellings of the same text match each other.
 
     Future enhancement: Implement proper collation-aware substring matching.
     """
 
     def icu_contains(needle: str, haystack: str) -> bool:
-        """Check if needle is in haystack.
-
-        This is a fallback implementation until proper ICU StringSearch support
-        is added. It provides reasonable behavior for most use cases.
-        """
-        # TODO: Use ICU StringSearch for proper collation-aware substring matching
-        # For now, fall back to Python's built-in contains
-        if case_sensitive:
-            return needle in haystack
-        else:
+        """Check if needle is in haystack."""
+        if needle.isascii() and haystack.isascii():
+            ## Nothing to normalize
+            if case_sensitive:
+                return needle in haystack
             return needle.lower() in haystack.lower()
+        return _normalized_contains(
+            _normalize_needle(needle, case_sensitive),
+            _normalize_for_search(haystack, case_sensitive),
+        )
 
     return icu_contains
 
 
-def _get_icu_sort_key(locale: str | None, case_sensitive: bool) -> Callable[[str], bytes]:
-    """Get ICU-based sort key function.
+@cache
+def _get_icu_collator(locale: str | None, strength: int) -> ICUCollator:
+    """Get a configured ICU collator, shared between all callers.
 
-    Creates a collator instance and returns a function that generates sort keys.
-    The collator strength is configured based on case_sensitive parameter.
+    Creating a collator means loading and parsing CLDR data, so there
+    is only one instance per (locale, strength) pair in the process.
+    Collators are only used for read-only operations after creation.
     """
     icu_locale = ICULocale(locale) if locale else ICULocale.getRoot()
     collator = ICUCollator.createInstance(icu_locale)
+    collator.setStrength(strength)
+    return collator
 
+
+def _get_icu_sort_key(locale: str | None, case_sensitive: bool) -> Callable[[str], bytes]:
+    """Get ICU-based sort key function.
+
+    Returns a function that generates sort keys using a shared collator.
+    The collator strength is configured based on case_sensitive parameter.
+    """
     # Set strength based on case sensitivity:
     # PRIMARY = base character differences only
     # SECONDARY = base + accent differences (case-insensitive)
     # TERTIARY = base + accent + case differences (case-sensitive, default)
     if case_sensitive:
-        collator.setStrength(ICUCollator.TERTIARY)
+        strength = ICUCollator.TERTIARY
     else:
-        collator.setStrength(ICUCollator.SECONDARY)
+        strength = ICUCollator.SECONDARY
+    collator = _get_icu_collator(locale, strength)
 
     def icu_sort_key(s: str) -> bytes:
         """Generate ICU collation sort key."""
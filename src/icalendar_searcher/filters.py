@@ -1,14 +1,432 @@
 """Filtering logic for icalendar components."""
 
-from collections.abc import Iterable
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from operator import attrgetter
+from typing import Any
 
 from icalendar import Component, error
-from icalendar.prop import vCategory, vText
-from recurring_ical_events import DATE_MAX_DT, DATE_MIN_DT
+from icalendar.prop import vCategory, vRecur, vText
 
-from .collation import Collation, get_collation_function
-from .utils import _normalize_dt
+from .collation import Collation, get_collation_function, get_sort_key_function
+from .utils import DATE_MAX_NORMALIZED, DATE_MIN_NORMALIZED, _normalize_dt
+
+
+class _Op(IntEnum):
+    """The supported property filter operators"""
+
+    UNDEF = 0
+    CONTAINS = 1
+    EQ = 2
+
+
+## _property_operator keeps the operator strings given to
+## add_property_filter, the compiled filters use the enum
+_OPERATORS = {"undef": _Op.UNDEF, "contains": _Op.CONTAINS, "==": _Op.EQ}
+
+
+@dataclass(slots=True)
+class _PropertyFilter:
+    """One property filter, with everything not depending on the
+    component resolved up front.
+
+    Built lazily by :meth:`FilterMixin._compile_property_filter` the
+    first time the filter is checked, and reused for every component
+    after that.
+    """
+
+    key: str
+    comp_key: str
+    operator: _Op
+    filter_value: Any
+    collation: Collation
+    case_sensitive: bool
+    locale: str | None
+    collation_fn: Callable[[str, str], bool] | None = None
+    sort_key_fn: Callable[[str], bytes] | None = None
+    ## The filter value as a string, for text and "category" filters
+    filter_str: str | None = None
+    ## Sort key of filter_str, for == with UNICODE/LOCALE collations
+    filter_sort_key: bytes | None = None
+    ## Case-folded filter value, for case-insensitive matching
+    filter_lower: str | frozenset[str] | None = None
+    ## One of the _match_* functions below, chosen for this filter
+    match: Callable[..., bool] | None = None
+    ## Rough cost of the match, filters are checked cheapest first:
+    ## 0 undef, 1 equality and set lookups, 2 SIMPLE substring
+    ## matching, 3 UNICODE/LOCALE collation
+    cost: int = 0
+
+
+def _normalize_categories_filter(filter_value: Any) -> str | frozenset[str]:
+    """Turn the filter value of a "categories" filter into either a
+    single category name or a frozenset of category names.
+
+    ``add_property_filter`` stores a vCategory, but plain strings and
+    other iterables of names are accepted as well.  Commas always
+    separate category names.
+    """
+    if isinstance(filter_value, vCategory):
+        items = filter_value.cats
+    elif isinstance(filter_value, (str, vText)):
+        items = (filter_value,)
+    else:
+        items = filter_value
+    names = frozenset(name for item in items for name in str(item).split(","))
+    if len(names) == 1:
+        return next(iter(names))
+    return names
+
+
+## DISCLAIMER: partly AI-generated code.  Refactored a bit by human hands
+##
+## Matchers for the property filters.  Which one to use is decided
+## once per filter by FilterMixin._compile_property_filter, so the
+## per-component work is only the comparison itself.  All matchers
+## take the same arguments: the filter, the component, the property
+## value (for category filters: the set of category names of the
+## component) and the case-folded category names (None if not needed).
+## A property not present in the component is passed as _MISSING.
+
+_MISSING = object()
+
+
+def _match_undef(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Property should NOT be defined"""
+    return value is _MISSING
+
+
+def _match_undef_categories(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """CATEGORIES should NOT be defined.
+
+    icalendar (>=6.x) provides a default empty vCategory object even
+    when CATEGORIES is not explicitly set in the iCalendar data, making
+    `"categories" in component` always True.  Check the set of
+    category names instead: if it is non-empty the property is
+    actually present.
+    """
+    return value is _MISSING or not value
+
+
+def _match_text_contains(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Property should contain the filter value (substring match)"""
+    if value is _MISSING:
+        return False
+    return entry.collation_fn(entry.filter_str, str(value))
+
+
+def _match_text_contains_binary(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Case-sensitive SIMPLE substring match, a plain ``in``"""
+    if value is _MISSING:
+        return False
+    return entry.filter_str in str(value)
+
+
+def _match_text_contains_folded(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Case-insensitive SIMPLE substring match, against the filter value
+    case-folded up front"""
+    if value is _MISSING:
+        return False
+    return entry.filter_lower in str(value).casefold()
+
+
+def _match_category_contains(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """ "category" (singular) does substring matching within category names"""
+    if value is _MISSING:
+        return False
+    filter_str = entry.filter_str
+    for cat in value:
+        if entry.collation_fn(filter_str, cat):
+            return True
+    return False
+
+
+def _match_category_contains_binary(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Case-sensitive SIMPLE substring match within category names"""
+    if value is _MISSING:
+        return False
+    filter_str = entry.filter_str
+    for cat in value:
+        if filter_str in cat:
+            return True
+    return False
+
+
+def _match_category_contains_folded(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """Case-insensitive SIMPLE substring match within category names"""
+    if value is _MISSING:
+        return False
+    filter_lower = entry.filter_lower
+    for cat in value_lower:
+        if filter_lower in cat:
+            return True
+    return False
+
+
+def _match_categories_contains_one(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """A single category should be among the component categories"""
+    if value is _MISSING:
+        return False
+    if not entry.case_sensitive:
+        return entry.filter_lower in value_lower
+    return entry.filter_value in value
+
+
+def _match_categories_contains_all(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """All filter categories should be among the component categories (subset check)"""
+    if value is _MISSING:
+        return False
+    if not entry.case_sensitive:
+        return entry.filter_lower <= value_lower
+    return entry.filter_value <= value
+
+
+def _match_category_eq(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """ "category" (singular) should exactly match at least one category name"""
+    if value is _MISSING:
+        return False
+    if not entry.case_sensitive:
+        return entry.filter_lower in value_lower
+    return entry.filter_str in value
+
+
+def _match_categories_eq_one(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """The component should have exactly the one filter category"""
+    if value is _MISSING:
+        return False
+    if len(value) != 1:
+        return False
+    if not entry.case_sensitive:
+        return entry.filter_lower in value_lower
+    return entry.filter_value in value
+
+
+def _match_categories_eq_all(
+    entry: _PropertyFilter, component: Component, value: Any, value_lower: Any
+) -> bool:
+    """The component categories should equal the filter categories"""
+    if value is _MISSING:
+        return False
+    if len(entry.filter_value) != len(value):
+        return False
+    if not entry.case_sensitive:
+        return entry.filter_lower == value_lower
+    return entry.filter_value == value
+
+
+def _match_eq(entry: _PropertyFilter, component: Component, value: Any, value_lower: Any) -> bool:
+    """Property should exactly match the filter value"""
+    if value is _MISSING:
+        return False
+    filter_value = entry.filter_value
+
+    ## Compare the values This is tricky, as the values
+    ## may have different types.  TODO: we should add more
+    ## logic for the different property types.  Maybe get
+    ## it into the icalendar library.
+    if value == filter_value:
+        return True
+    if isinstance(filter_value, str) and isinstance(value, set):
+        return filter_value in value
+
+    # For text properties, use collation for exact match comparison
+    if isinstance(filter_value, (str, vText)) and isinstance(value, (str, vText)):
+        comp_str = str(value)
+
+        # Use collation-specific comparison
+        if entry.collation == Collation.SIMPLE:
+            if entry.case_sensitive:
+                return comp_str == entry.filter_str
+            else:
+                return comp_str.casefold() == entry.filter_lower
+        elif entry.sort_key_fn is not None:
+            # For UNICODE/LOCALE collations, use sort keys for comparison
+            # Two strings are equal if they have the same sort key
+            return entry.sort_key_fn(comp_str) == entry.filter_sort_key
+
+    return False
+
+
+## Stand-ins for an open end of a time or alarm range.  Normalized
+## times are timezone-aware, so the sentinels are as well.
+_DATETIME_MIN = datetime.min.replace(tzinfo=timezone.utc)
+_DATETIME_MAX = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def _repeats_in_range(
+    first: datetime, duration: timedelta, repeat_count: int, lo: datetime, hi: datetime
+) -> bool:
+    """Check if any of the alarm times ``first + duration * i`` for
+    ``i`` in ``0 .. repeat_count`` falls within ``lo <= t < hi``.
+
+    Rather than trying each repetition, compute the first one not
+    before ``lo`` and check it against ``hi``.
+    """
+    if duration < timedelta(0):
+        ## Same set of times, counted from the last one
+        first = first + duration * repeat_count
+        duration = -duration
+    if first >= lo:
+        i = 0
+    else:
+        ## ceil((lo - first) / duration)
+        i = -((first - lo) // duration)
+        if i > repeat_count:
+            return False
+    return first + duration * i < hi
+
+
+## Per component type adjustments of the (normalized) start and end
+## of a component before the time range comparison in
+## FilterMixin._check_range.  Each handler returns the adjusted
+## (comp_start, comp_end), or (None, None) if the component can never
+## match a time range.
+
+
+def _range_event(
+    component: Component, comp_start: datetime, comp_end: datetime | None
+) -> tuple[datetime, datetime]:
+    """VEVENT: comp_start is always set"""
+    if not comp_end:
+        ## if comp_end is not set, consider zero duration.  All-day
+        ## events without DTEND get their one day duration from
+        ## icalendar's end property
+        comp_end = comp_start
+    return comp_start, comp_end
+
+
+def _range_todo(
+    component: Component, comp_start: datetime | None, comp_end: datetime | None
+) -> tuple[datetime, datetime]:
+    """VTODO: There is a long matrix for VTODO in the RFC, and it
+    may seem complicated, but it isn't that bad"""
+    ## * A task with DTSTART and DURATION is equivalent with a
+    ##   task with DTSTART and DUE.  This complexity is
+    ##   already handled by the icalendar library, so all rows
+    ##   in the matrix where VTODO has the DURATION property?"
+    ##   is Y may be removed.
+    ##
+    ## * If either DUE or DTSTART is set, use it.
+    if comp_end and not comp_start:
+        comp_start = comp_end
+    if comp_start and not comp_end:
+        comp_end = comp_start
+
+    ## * If both created/completed is set and
+    ##   comp_start/comp_end is not set, then use those instead
+    if not comp_start:
+        if "CREATED" in component:
+            comp_start = _normalize_dt(component["CREATED"].dt)
+        if "COMPLETED" in component:
+            comp_end = _normalize_dt(component["COMPLETED"].dt)
+
+    ## * A task may have a DUE before the DTSTART.  The
+    ##   complicated OR-logic in the table may be eliminated
+    ##   by swapping start/end if necessary:
+    if comp_end and comp_start and comp_end < comp_start:
+        comp_start, comp_end = comp_end, comp_start
+
+    ## * A task with no timestamps is considered to be done "at any or all days".
+    if not comp_end and not comp_start:
+        comp_start = DATE_MIN_NORMALIZED
+        comp_end = DATE_MAX_NORMALIZED
+    return comp_start, comp_end
+
+
+def _range_journal(
+    component: Component, comp_start: datetime | None, comp_end: datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """VJOURNAL: an entry without DTSTART doesn't match time ranges"""
+    if not comp_start:
+        return None, None
+    return comp_start, comp_start
+
+
+## Length of one FREQ period, for the frequencies where every
+## period has exactly one occurrence when no BYxxx rule parts are given
+_FREQ_DELTAS = {
+    "SECONDLY": timedelta(seconds=1),
+    "MINUTELY": timedelta(minutes=1),
+    "HOURLY": timedelta(hours=1),
+    "DAILY": timedelta(days=1),
+    "WEEKLY": timedelta(weeks=1),
+}
+
+
+def _rrule_part(rrule: vRecur, name: str) -> Any:
+    """A single rule part of a RRULE, or None.  Parsed rules hold
+    lists of values, rules built in code may hold the value itself."""
+    value = rrule.get(name)
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _last_recurrence_start(rrule: vRecur, comp_start: datetime) -> datetime | None:
+    """Latest possible (normalized) start of an occurrence of a RRULE
+    starting at ``comp_start``, or None if it can't be told without
+    expanding the rule.
+
+    UNTIL bounds the rule directly.  COUNT is only used for the fixed
+    length frequencies without BYxxx parts, as with those the
+    occurrences are evenly spaced.
+    """
+    until = _rrule_part(rrule, "UNTIL")
+    if until is not None:
+        return _normalize_dt(until)
+    count = _rrule_part(rrule, "COUNT")
+    delta = _FREQ_DELTAS.get(_rrule_part(rrule, "FREQ"))
+    if count is None or delta is None or any(key.startswith("BY") for key in rrule):
+        return None
+    interval = _rrule_part(rrule, "INTERVAL") or 1
+    return comp_start + delta * (int(interval) * (int(count) - 1))
+
+
+def _start_end(component: Component) -> tuple[datetime | None, datetime | None]:
+    """The normalized start and end of a component, None where missing.
+    Needed by both the time range and the alarm checks."""
+    try:
+        comp_start = _normalize_dt(component.start)
+    except error.IncompleteComponent:
+        comp_start = None
+    try:
+        comp_end = _normalize_dt(component.end)
+    except error.IncompleteComponent:
+        comp_end = None
+    return comp_start, comp_end
+
+
+_RANGE_HANDLERS = {
+    "VEVENT": _range_event,
+    "VTODO": _range_todo,
+    "VJOURNAL": _range_journal,
+}
 
 
 class FilterMixin:
@@ -23,17 +441,29 @@ class FilterMixin:
     - _property_operator: dict of property operators
     - _property_collation: dict of property collations
     - _property_locale: dict of property locales
+    - _property_case_sensitive: dict of property case sensitivity flags
+    - _compiled_filters: dict of :class:`_PropertyFilter`, a cache to be
+      cleared for a key whenever the filter on that key changes.  Kept
+      ordered cheapest first by :meth:`_compile_property_filters`
     """
 
-    def _check_range(self, component: Component) -> bool:
+    def _check_range(
+        self,
+        component: Component,
+        start_end: tuple[datetime | None, datetime | None] | None = None,
+    ) -> bool:
         """Check if a component falls within the time range specified by self.start and self.end.
 
         Implements RFC4791 section 9.9 time-range filtering logic for VEVENT, VTODO, and VJOURNAL.
 
         :param component: A single calendar component (VEVENT, VTODO, or VJOURNAL)
+        :param start_end: The component's normalized start and end, as
+            given by :func:`_start_end`, if already known
         :return: True if the component matches the time range, False otherwise
         """
-        comp_name = component.name
+        if not self.start and not self.end:
+            ## No time range given, everything matches
+            return True
 
         ## The logic below should correspond neatly with RFC4791 section 9.9
 
@@ -43,80 +473,17 @@ class FilterMixin:
         ## This logic is all handled by the start/end properties in the
         ## icalendar library, and makes the logic here less complex
 
-        try:
-            comp_end = _normalize_dt(component.end)
-        except error.IncompleteComponent:
-            comp_end = None
-
-        try:
+        comp_start, comp_end = start_end or _start_end(component)
+        if comp_start is None and component.name == "VEVENT":
+            ## for events, DTSTART is mandatory.  Let icalendar raise
+            ## the IncompleteComponent error
             comp_start = _normalize_dt(component.start)
-        except error.IncompleteComponent:
-            if component.name == "VEVENT":
-                ## for events, DTSTART is mandatory
-                raise
-            comp_start = None
-
-        if comp_name == "VEVENT":
-            ## comp_start is always set.
-            if not comp_end and isinstance(comp_start, datetime):
-                ## if comp_end is not set and comp_start is a datetime,
-                ## consider zero duration
-                comp_end = comp_start
-            elif not comp_end:
-                ## if comp_end is not set and comp_start is a datetime,
-                ## consider one day duration
-                comp_end = comp_start + timedelta(day=1)
-                ## TODO: What time of the day does the day change?
-                ## Time zones are difficult!  TODO: as for now,
-                ## self.start is a datetime, but in the future dates
-                ## should be allowed as well.  Then the time zone
-                ## problem for full-day events is at least simplified.
-
-        elif comp_name == "VTODO":
-            ## There is a long matrix for VTODO in the RFC, and it
-            ## may seem complicated, but it isn't that bad:
-
-            ## * A task with DTSTART and DURATION is equivalent with a
-            ##   task with DTSTART and DUE.  This complexity is
-            ##   already handled by the icalendar library, so all rows
-            ##   in the matrix where VTODO has the DURATION property?"
-            ##   is Y may be removed.
-            ##
-            ## * If either DUE or DTSTART is set, use it.
-            if comp_end and not comp_start:
-                comp_start = comp_end
-            if comp_start and not comp_end:
-                comp_end = comp_start
-
-            ## * If both created/completed is set and
-            ##   comp_start/comp_end is not set, then use those instead
-            if not comp_start:
-                if "CREATED" in component:
-                    comp_start = _normalize_dt(component["CREATED"].dt)
-                if "COMPLETED" in component:
-                    comp_end = _normalize_dt(component["COMPLETED"].dt)
-
-            ## * A task may have a DUE before the DTSTART.  The
-            ##   complicated OR-logic in the table may be eliminated
-            ##   by swapping start/end if necessary:
-            if comp_end and comp_start and comp_end < comp_start:
-                tmp = comp_start
-                comp_start = comp_end
-                comp_end = tmp
-
-            ## * A task with no timestamps is considered to be done "at any or all days".
-            if not comp_end and not comp_start:
-                comp_start = _normalize_dt(DATE_MIN_DT)
-                comp_end = _normalize_dt(DATE_MAX_DT)
-
-        elif comp_name == "VJOURNAL":
-            if not comp_start:
-                ## Journal without DTSTART doesn't match time ranges
+
+        handler = _RANGE_HANDLERS.get(component.name)
+        if handler is not None:
+            comp_start, comp_end = handler(component, comp_start, comp_end)
+            if comp_start is None and comp_end is None:
                 return False
-            if isinstance(comp_start, datetime):
-                comp_end = comp_start
-            else:
-                comp_end = comp_start + timedelta(days=1)
 
         if comp_start == comp_end:
             ## Now the match requirement is start <= comp_end
@@ -125,16 +492,99 @@ class FilterMixin:
             comp_end += timedelta(seconds=1)
 
         ## After the logic above, all rows in the matrix boils down to
-        ## this: (we could reduce it even more by defaulting
-        ## self.start and self.end to DATE_MIN_DT etc)
-        if self.start and self.end and comp_end:
-            return self.start < comp_end and self.end > comp_start
-        elif self.end:
-            return self.end > comp_start
-        elif self.start and comp_end:
-            return self.start < comp_end
+        ## this, with the open ends of the search range and a missing
+        ## comp_start or comp_end taken as unbounded (i.e. a task
+        ## having COMPLETED but neither DTSTART, DUE nor CREATED)
+        if comp_start is None:
+            comp_start = _DATETIME_MIN
+        if comp_end is None:
+            comp_end = _DATETIME_MAX
+        return (self.start or _DATETIME_MIN) < comp_end and (self.end or _DATETIME_MAX) > comp_start
+
+    def _recurrence_set_could_overlap(self, recurrence_set: list[Component]) -> bool:
+        """Cheap check, done before expanding a recurrence set, whether
+        any occurrence may fall within the time range at all.
+
+        Only a lone master component without RDATE is ruled out: its
+        occurrences can't start before DTSTART (or DUE, for a task
+        being due before its start) nor after the last occurrence
+        allowed by the RRULE (see :func:`_last_recurrence_start`).
+        Overridden occurrences and RDATEs may be moved anywhere.
+
+        :param recurrence_set: The unexpanded recurrence set
+        :return: False if no occurrence can match the time range
+        """
+        if len(recurrence_set) != 1:
+            return True
+        master = recurrence_set[0]
+        rrule = master.get("RRULE")
+        if "RDATE" in master or not isinstance(rrule, vRecur):
+            return True
+        comp_start, comp_end = _start_end(master)
+        if comp_start is None:
+            return True
+        first = min(comp_start, comp_end) if comp_end else comp_start
+        if self.end and first >= self.end:
+            return False
+
+        if self.start:
+            last = _last_recurrence_start(rrule, comp_start)
+            if last is not None:
+                duration = abs(comp_end - comp_start) if comp_end else timedelta(0)
+                ## A day of slack for date-valued or floating UNTIL and
+                ## for DST changes between the first and last occurrence
+                if last + duration + timedelta(days=1) < self.start:
+                    return False
         return True
 
+    def _alarm_expansion_window(
+        self, recurrence_set: list[Component]
+    ) -> tuple[datetime, datetime] | None:
+        """Time range an alarm search needs to expand a recurrence set
+        within.
+
+        An occurrence's relative alarms fire at fixed offsets from its
+        start, so only occurrences starting within the alarm range
+        shifted by those offsets can match.  Absolute triggers fire at
+        the same time for every occurrence, hence can't narrow it down.
+
+        :param recurrence_set: The unexpanded recurrence set
+        :return: (start, end) to expand within, or None if all of the
+            time range is needed
+        """
+        min_offset = max_offset = None
+        for comp in recurrence_set:
+            comp_start, comp_end = _start_end(comp)
+            for alarm in comp.subcomponents:
+                if alarm.name != "VALARM" or "TRIGGER" not in alarm:
+                    continue
+                trigger = alarm["TRIGGER"]
+                offset = getattr(trigger, "dt", None)
+                if not isinstance(offset, timedelta) or comp_start is None:
+                    return None
+                if trigger.params.get("RELATED") == "END" and comp_end:
+                    offset += comp_end - comp_start
+                offsets = [offset]
+                if "REPEAT" in alarm and "DURATION" in alarm:
+                    duration = getattr(alarm["DURATION"], "dt", None)
+                    if duration:
+                        offsets.append(offset + duration * int(alarm["REPEAT"]))
+                lo, hi = min(offsets), max(offsets)
+                min_offset = lo if min_offset is None else min(min_offset, lo)
+                max_offset = hi if max_offset is None else max(max_offset, hi)
+        if min_offset is None:
+            return None
+
+        ## A day of slack for date-valued and floating components and
+        ## for DST changes between the occurrences
+        start = DATE_MIN_NORMALIZED
+        end = DATE_MAX_NORMALIZED
+        if self.alarm_start:
+            start = self.alarm_start - max_offset - timedelta(days=1)
+        if self.alarm_end:
+            end = self.alarm_end - min_offset + timedelta(days=1)
+        return start, end
+
     def _check_completed_filter(self, component: Component) -> bool:
         """Check if a component should be included based on the include_completed filter.
 
@@ -158,9 +608,120 @@ class FilterMixin:
 
         return True
 
-    ## DISCLAIMER: partly AI-generated code.  Refactored a bit by human hands
-    ## Should be refactored more, there is quite some code duplication here.
-    ## Code duplication is bad, IMO.
+    def _compile_property_filter(self, key: str) -> _PropertyFilter:
+        """Resolve the settings of the property filter on ``key``.
+
+        Collation lookups, preprocessing of the filter value and the
+        choice of matcher only depend on the filter, so this is done
+        once rather than for every component checked.
+        """
+        operator = _OPERATORS.get(self._property_operator[key])
+        if operator is None:
+            ## This shouldn't happen as add_property_filter validates operators
+            raise NotImplementedError(f"Operator {self._property_operator[key]} not implemented")
+        filter_value = self._property_filters.get(key)
+        entry = _PropertyFilter(
+            key=key,
+            # Map "category" (singular) to "CATEGORIES" (plural) in the component
+            comp_key="categories" if key in ("categories", "category") else key,
+            operator=operator,
+            filter_value=filter_value,
+            collation=self._property_collation.get(key, Collation.SIMPLE),
+            case_sensitive=self._property_case_sensitive.get(key, True),
+            locale=self._property_locale.get(key),
+        )
+        if operator is _Op.UNDEF:
+            if key in ("categories", "category"):
+                entry.match = _match_undef_categories
+            else:
+                entry.match = _match_undef
+        elif key == "categories":
+            ## "categories" (plural) needs special preprocessing - split on commas
+            entry.cost = 1
+            filter_value = _normalize_categories_filter(filter_value)
+            if isinstance(filter_value, str):
+                entry.filter_value = filter_value
+                entry.filter_lower = filter_value.casefold()
+                if operator is _Op.CONTAINS:
+                    entry.match = _match_categories_contains_one
+                else:
+                    entry.match = _match_categories_eq_one
+            else:
+                entry.filter_value = filter_value
+                entry.filter_lower = frozenset(x.casefold() for x in filter_value)
+                if operator is _Op.CONTAINS:
+                    entry.match = _match_categories_contains_all
+                else:
+                    entry.match = _match_categories_eq_all
+        elif key == "category":
+            entry.filter_str = str(filter_value)
+            entry.filter_lower = entry.filter_str.casefold()
+            if operator is _Op.CONTAINS:
+                entry.cost = 2
+                if entry.collation is Collation.SIMPLE:
+                    if entry.case_sensitive:
+                        entry.match = _match_category_contains_binary
+                    else:
+                        entry.match = _match_category_contains_folded
+                else:
+                    if entry.collation in (Collation.UNICODE, Collation.LOCALE):
+                        entry.cost = 3
+                    entry.collation_fn = get_collation_function(
+                        entry.collation, entry.case_sensitive, entry.locale
+                    )
+                    entry.match = _match_category_contains
+            else:
+                entry.match = _match_category_eq
+                entry.cost = 1
+        elif operator is _Op.CONTAINS:
+            entry.filter_str = str(filter_value)
+            entry.cost = 2
+            if entry.collation is Collation.SIMPLE:
+                ## No need to go through a collation function.  The
+                ## needle is case-folded once here rather than for
+                ## every component
+                if entry.case_sensitive:
+                    entry.match = _match_text_contains_binary
+                else:
+                    entry.filter_lower = entry.filter_str.casefold()
+                    entry.match = _match_text_contains_folded
+            else:
+                if entry.collation in (Collation.UNICODE, Collation.LOCALE):
+                    entry.cost = 3
+                entry.collation_fn = get_collation_function(
+                    entry.collation, entry.case_sensitive, entry.locale
+                )
+                entry.match = _match_text_contains
+        else:
+            entry.filter_str = str(filter_value)
+            entry.cost = 1
+            if entry.collation in (Collation.UNICODE, Collation.LOCALE):
+                ## For UNICODE/LOCALE collations, equality is checked on sort keys
+                entry.sort_key_fn = get_sort_key_function(
+                    entry.collation, entry.case_sensitive, entry.locale
+                )
+                entry.filter_sort_key = entry.sort_key_fn(entry.filter_str)
+                entry.cost = 3
+            elif not entry.case_sensitive:
+                entry.filter_lower = entry.filter_str.casefold()
+            entry.match = _match_eq
+        return entry
+
+    def _compile_property_filters(self) -> dict[str, _PropertyFilter]:
+        """Bring the compiled filters in line with ``self._property_operator``.
+
+        Filters already compiled are reused.  The result is ordered
+        cheapest first, so that the expensive collation-based filters
+        are only reached by components passing the cheap ones.
+        """
+        entries = [
+            self._compiled_filters.get(key) or self._compile_property_filter(key)
+            for key in self._property_operator
+        ]
+        entries.sort(key=attrgetter("cost"))
+        self._compiled_filters = {entry.key: entry for entry in entries}
+        return self._compiled_filters
+
     def _check_property_filters(self, component: Component, skip_undef: bool = False) -> bool:
         """Check if a component matches all property filters.
 
@@ -173,214 +734,61 @@ class FilterMixin:
             them explicitly, which would otherwise cause false negatives.
         :return: True if the component matches all property filters, False otherwise
         """
-        for key, operator in self._property_operator.items():
-            filter_value = self._property_filters.get(key)
-
-            # Map "category" (singular) to "CATEGORIES" (plural) in the component
-            if key in ("categories", "category"):
-                comp_key = "categories"
-                comp_value = set([str(x) for x in component.categories])
-            else:
-                comp_key = key
-                comp_value = component.get(comp_key)
-
-            # Get collation settings for this property
-            collation = self._property_collation.get(key, Collation.SIMPLE)
-            locale = self._property_locale.get(key)
-            case_sensitive = self._property_case_sensitive.get(key, True)
+        ## The category names of the component are shared by all
+        ## category filters, computed at most once per component
+        comp_categories = None
+        comp_categories_lower = None
+
+        compiled = self._compiled_filters
+        if compiled.keys() != self._property_operator.keys():
+            compiled = self._compile_property_filters()
+
+        for entry in compiled.values():
+            if skip_undef and entry.operator is _Op.UNDEF:
+                ## The base (master) element of this recurrence set already
+                ## passed the undef check.  Expanded occurrences may have
+                ## this property added as a computed value by
+                ## recurring_ical_events (e.g. DTEND for all-day events), so
+                ## we skip the check here to avoid false negatives.
+                continue
 
-            ## "categories" (plural) needs special preprocessing - split on commas
-            if key == "categories" and comp_value is not None and filter_value is not None:
-                if isinstance(filter_value, vCategory):
-                    ## TODO: This special case, handling one element different from several, is a bit bad indeed
-                    if len(filter_value.cats) == 1:
-                        filter_value = str(filter_value.cats[0])
-                        if "," in filter_value:
-                            filter_value = set(filter_value.split(","))
+            if entry.comp_key == "categories":
+                if comp_categories is None:
+                    if "categories" in component:
+                        comp_categories = {str(x) for x in component.categories}
                     else:
-                        filter_value = set([str(x) for x in filter_value.cats])
-                elif isinstance(filter_value, str) or isinstance(filter_value, vText):
-                    ## TODO: probably this is irrelevant dead code
-                    filter_value = str(filter_value)
-                    if "," in filter_value:
-                        filter_value = set(filter_value.split(","))
-                elif isinstance(filter_value, Iterable):
-                    ## TODO: probably this is irrelevant dead code
-                    # Convert iterable to set, splitting on commas if strings contain them
-                    result_set = set()
-                    for item in filter_value:
-                        item_str = str(item)
-                        if "," in item_str:
-                            result_set.update(item_str.split(","))
-                        else:
-                            result_set.add(item_str)
-                    filter_value = result_set
-            if operator == "undef":
-                if skip_undef:
-                    ## The base (master) element of this recurrence set already
-                    ## passed the undef check.  Expanded occurrences may have
-                    ## this property added as a computed value by
-                    ## recurring_ical_events (e.g. DTEND for all-day events), so
-                    ## we skip the check here to avoid false negatives.
-                    continue
-                ## Property should NOT be defined
-                if key in ("categories", "category"):
-                    ## icalendar (>=6.x) provides a default empty vCategory object
-                    ## even when CATEGORIES is not explicitly set in the iCalendar data,
-                    ## making `"categories" in component` always True.  Check the
-                    ## already-computed comp_value set instead: if it is non-empty the
-                    ## property is actually present.
-                    if comp_value:
-                        return False
-                elif comp_key in component:
-                    return False
-            elif operator == "contains":
-                ## Property should contain the filter value (substring match)
-                if comp_key not in component:
-                    return False
-                if key == "category":
-                    # "category" (singular) does substring matching within category names
-                    # comp_value is a vCategory object
-                    if comp_value is not None:
-                        filter_str = str(filter_value)
-                        # Check if filter_str is a substring of any category
-                        collation_fn = get_collation_function(collation, case_sensitive, locale)
-                        for cat in comp_value:
-                            if collation_fn(filter_str, cat):
-                                return True
-                    return False
-                if key == "categories":
-                    # For categories, "contains" means filter categories is a subset of component categories
-                    # filter_value can be a string (single category) or set (multiple categories)
-                    if isinstance(filter_value, str):
-                        # Single category: check if it's in component categories
-                        if not case_sensitive:
-                            return any(filter_value.lower() == cv.lower() for cv in comp_value)
-                        else:
-                            return filter_value in comp_value
+                        comp_categories = _MISSING
+                if not entry.case_sensitive and comp_categories_lower is None:
+                    if comp_categories is _MISSING:
+                        comp_categories_lower = _MISSING
                     else:
-                        # Multiple categories (set): check if all are in component categories (subset check)
-                        assert isinstance(filter_value, set), (
-                            f"Expected set but got {type(filter_value)}"
-                        )
-                        for fv in filter_value:
-                            if not case_sensitive:
-                                if not any(fv.lower() == cv.lower() for cv in comp_value):
-                                    return False
-                            else:
-                                if fv not in comp_value:
-                                    return False
-                        return True
-
-                ## Convert to string for substring matching
-                comp_str = str(comp_value)
-                filter_str = str(filter_value)
-
-                # Use collation function for text matching
-                collation_fn = get_collation_function(collation, case_sensitive, locale)
-                if not collation_fn(filter_str, comp_str):
-                    return False
-            elif operator == "==":
-                ## Property should exactly match the filter value
-                if comp_key not in component:
-                    return False
-
-                ## For "category" (singular), check exact match to at least one category name
-                if key == "category":
-                    if comp_value is not None:
-                        filter_str = str(filter_value)
-                        # Check if filter_str exactly matches any category
-                        for cat in comp_value:
-                            if not case_sensitive:
-                                if filter_str.lower() == cat.lower():
-                                    return True
-                            else:
-                                if filter_str == cat:
-                                    return True
+                        comp_categories_lower = {x.casefold() for x in comp_categories}
+                if not entry.match(entry, component, comp_categories, comp_categories_lower):
                     return False
-
-                ## For categories, check exact set equality with collation support
-                if key == "categories":
-                    # filter_value can be a string (single category) or set (multiple categories)
-                    assert isinstance(comp_value, set), f"Expected set but got {type(comp_value)}"
-
-                    if isinstance(filter_value, str):
-                        # Single category with "==" operator: component must have exactly that one category
-                        if len(comp_value) != 1:
-                            return False
-                        if not case_sensitive:
-                            return filter_value.lower() == list(comp_value)[0].lower()
-                        else:
-                            return filter_value in comp_value
-                    else:
-                        # Multiple categories (set): check exact equality with collation
-                        assert isinstance(filter_value, set), (
-                            f"Expected set but got {type(filter_value)}"
-                        )
-                        if len(filter_value) != len(comp_value):
-                            return False
-                        # Check if all filter categories have a matching component category
-                        for fv in filter_value:
-                            found = False
-                            for cv in comp_value:
-                                if not case_sensitive:
-                                    if fv.lower() == cv.lower():
-                                        found = True
-                                        break
-                                else:
-                                    if fv == cv:
-                                        found = True
-                                        break
-                            if not found:
-                                return False
-                        return True
-
-                ## Compare the values This is tricky, as the values
-                ## may have different types.  TODO: we should add more
-                ## logic for the different property types.  Maybe get
-                ## it into the icalendar library.
-                if comp_value == filter_value:
-                    return True
-                if isinstance(filter_value, str) and isinstance(comp_value, set):
-                    return filter_value in comp_value
-
-                # For text properties, use collation for exact match comparison
-                if isinstance(filter_value, (str, vText)) and isinstance(comp_value, (str, vText)):
-                    comp_str = str(comp_value)
-                    filter_str = str(filter_value)
-
-                    # Use collation-specific comparison
-                    if collation == Collation.SIMPLE:
-                        if case_sensitive:
-                            return comp_str == filter_str
-                        else:
-                            return comp_str.lower() == filter_str.lower()
-                    elif collation in (Collation.UNICODE, Collation.LOCALE):
-                        # For UNICODE/LOCALE collations, use sort keys for comparison
-                        # Two strings are equal if they have the same sort key
-                        from .collation import get_sort_key_function
-
-                        sort_key_fn = get_sort_key_function(collation, case_sensitive, locale)
-                        return sort_key_fn(comp_str) == sort_key_fn(filter_str)
-
+            elif not entry.match(entry, component, component.get(entry.comp_key, _MISSING), None):
                 return False
-            else:
-                ## This shouldn't happen as add_property_filter validates operators
-                raise NotImplementedError(f"Operator {operator} not implemented")
 
         return True
 
     ## DISCLAIMER: Mostly AI-generated code, with a touch of human polishing
     ## and bugfixing. Alarms are a bit complex.
-    def _check_alarm_range(self, component: Component) -> bool:
+    def _check_alarm_range(
+        self,
+        component: Component,
+        start_end: tuple[datetime | None, datetime | None] | None = None,
+    ) -> bool:
         """Check if a component has alarms that fire within the alarm time range.
 
         Implements RFC 4791 section 9.9 alarm time-range filtering.
 
         :param component: A single calendar component (VEVENT, VTODO, or VJOURNAL)
+        :param start_end: The component's normalized start and end, as
+            given by :func:`_start_end`, if already known
         :return: True if any alarm fires within the alarm range, False otherwise
         """
-        from datetime import timedelta
+        if not self.alarm_start and not self.alarm_end:
+            ## No alarm range given - nothing can fire within it
+            return False
 
         ## Get all VALARM subcomponents
         alarms = [x for x in component.subcomponents if x.name == "VALARM"]
@@ -392,16 +800,11 @@ class FilterMixin:
         ## Get component start/end for relative trigger calculations
         ## Use try/except because .start/.end may raise IncompleteComponent
         ## For VTODO, RFC 5545 says TRIGGER is relative to DUE if present, else DTSTART
-        comp_start = None
-        comp_end = None
-        try:
-            comp_start = _normalize_dt(component.start)
-        except error.IncompleteComponent:
-            pass
-        try:
-            comp_end = _normalize_dt(component.end)
-        except error.IncompleteComponent:
-            pass
+        comp_start, comp_end = start_end or _start_end(component)
+
+        ## An open end of the alarm range is unbounded
+        alarm_lo = self.alarm_start or _DATETIME_MIN
+        alarm_hi = self.alarm_end or _DATETIME_MAX
 
         ## For each alarm, calculate when it fires
         for alarm in alarms:
@@ -447,31 +850,15 @@ class FilterMixin:
                 duration = alarm["DURATION"].dt if hasattr(alarm["DURATION"], "dt") else None
 
                 if duration:
-                    ## Check each repetition
-                    for i in range(int(repeat_count) + 1):
-                        repeat_time = alarm_time + (duration * i)
-                        ## Check if this repetition fires within the alarm range
-                        if self.alarm_start and self.alarm_end:
-                            if self.alarm_start <= repeat_time < self.alarm_end:
-                                return True
-                        elif self.alarm_start:
-                            if repeat_time >= self.alarm_start:
-                                return True
-                        elif self.alarm_end:
-                            if repeat_time < self.alarm_end:
-                                return True
+                    if _repeats_in_range(
+                        alarm_time, duration, int(repeat_count), alarm_lo, alarm_hi
+                    ):
+                        return True
                     ## None of the repetitions matched
                     continue
 
             ## Check if this alarm (first occurrence) fires within the alarm range
-            if self.alarm_start and self.alarm_end:
-                if self.alarm_start <= alarm_time < self.alarm_end:
-                    return True
-            elif self.alarm_start:
-                if alarm_time >= self.alarm_start:
-                    return True
-            elif self.alarm_end:
-                if alarm_time < self.alarm_end:
-                    return True
+            if alarm_lo <= alarm_time < alarm_hi:
+                return True
 
         return False
@@ -3,23 +3,95 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 import recurring_ical_events
 from icalendar import Calendar, Component, Timezone
-from recurring_ical_events import DATE_MAX_DT, DATE_MIN_DT
+from icalendar.prop import vDDDTypes
 
 from .collation import Collation, get_sort_key_function
-from .filters import FilterMixin
-from .utils import _iterable_or_false, _normalize_dt, types_factory
+from .filters import _MISSING, FilterMixin, _start_end
+from .utils import (
+    DATE_MAX_NORMALIZED,
+    DATE_MIN_NORMALIZED,
+    _normalize_dt,
+    types_factory,
+)
 
 if TYPE_CHECKING:
     from caldav.calendarobjectresource import CalendarObjectResource
 
 
+def _first_non_tz(calendar: Calendar) -> Component:
+    """The first subcomponent of a calendar that isn't a VTIMEZONE"""
+    for x in calendar.subcomponents:
+        if not isinstance(x, Timezone):
+            return x
+    raise ValueError("Empty component?")
+
+
+def _split_timezones(calendar: Calendar) -> tuple[list[Timezone], list[Component]]:
+    """The VTIMEZONE subcomponents of a calendar and the other
+    subcomponents, sorted out in one pass"""
+    timezones = []
+    others = []
+    for comp in calendar.subcomponents:
+        (timezones if isinstance(comp, Timezone) else others).append(comp)
+    return timezones, others
+
+
+@lru_cache(maxsize=128)
+def _factory_for(property_key: str) -> type:
+    """The icalendar value type of a property.  Looked up for every
+    component missing a timestamp sort key, hence cached."""
+    return types_factory.for_property(property_key)
+
+
+## Translation table flipping all bits of a byte, so byte strings
+## sort in reverse order
+_INVERT_TABLE = bytes(b ^ 0xFF for b in range(256))
+
+
+## Sort values for components not having the sort key property.
+## Timestamps are sorted as POSIX timestamps of the normalized value.
+## TODO: all possible non-string sort attributes needs to be listed here, otherwise we will get type errors when comparing objects with the property defined vs undefined (or maybe we should make an "undefined" object that always will compare below any other type?  Perhaps there exists such an object already?)
+_SORT_DEFAULTS = {
+    "due": _normalize_dt(datetime(2050, 1, 1)).timestamp(),
+    "dtstart": _normalize_dt(datetime(1970, 1, 1)).timestamp(),
+    "priority": 0,
+    "category": "",
+}
+_STATUS_DEFAULTS = {
+    "VTODO": "NEEDS-ACTION",
+    "VJOURNAL": "FINAL",
+    "VEVENT": "TENTATIVE",
+}
+
+
+def _sort_default(comp: Component, sort_key: str, now: datetime) -> Any:
+    """Sort value of ``sort_key`` for a component not having it set.
+
+    :param now: The normalized wall clock
+    """
+    if sort_key == "isnt_overdue":
+        return not ("due" in comp and _normalize_dt(comp["due"].dt) < now)
+    if sort_key == "hasnt_started":
+        return "dtstart" in comp and _normalize_dt(comp["dtstart"].dt) > now
+    if sort_key == "status":
+        return _STATUS_DEFAULTS[comp.name]
+    if sort_key in _SORT_DEFAULTS:
+        return _SORT_DEFAULTS[sort_key]
+    if _factory_for(sort_key) is vDDDTypes:
+        ## Missing timestamps sort first
+        return float("-inf")
+    return ""
+
+
 @dataclass
 class Searcher(FilterMixin):
     """This class will:
@@ -132,6 +204,8 @@ class Searcher(FilterMixin):
     _property_collation: dict = field(default_factory=dict)
     _property_locale: dict = field(default_factory=dict)
     _property_case_sensitive: dict = field(default_factory=dict)
+    _compiled_filters: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _sort_key_functions: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def add_property_filter(
         self,
@@ -227,14 +301,14 @@ class Searcher(FilterMixin):
             if key == "categories" and isinstance(value, str):
                 ## If someone asks for FAMILY,FINANCE, they want a match on anything
                 ## having both those categories set, not a category literally named "FAMILY,FINANCE"
-                fact = types_factory.for_property(property_key)
+                fact = _factory_for(property_key)
                 self._property_filters[key] = fact(fact.from_ical(value))
             elif key == "category":
                 ## For "category" (singular), store as string (no comma splitting)
                 ## This allows substring matching within category names
                 self._property_filters[key] = value
             else:
-                self._property_filters[key] = types_factory.for_property(property_key)(value)
+                self._property_filters[key] = _factory_for(property_key)(value)
         self._property_operator[key] = operator
 
         # Determine collation strategy
@@ -249,6 +323,9 @@ class Searcher(FilterMixin):
             self._property_locale[key] = None
             self._property_case_sensitive[key] = case_sensitive
 
+        ## Compiled on first use (see FilterMixin._compile_property_filter)
+        self._compiled_filters.pop(key, None)
+
     def add_sort_key(
         self,
         key: str,
@@ -303,6 +380,9 @@ class Searcher(FilterMixin):
             self._sort_locale[key] = None
             self._sort_case_sensitive[key] = case_sensitive
 
+        ## Looked up on first use by sorting_value
+        self._sort_key_functions.pop(key, None)
+
     def check_component(
         self,
         component: Calendar | Component | CalendarObjectResource,
@@ -347,6 +427,37 @@ class Searcher(FilterMixin):
         if expand_only and not self.expand:
             return orig_recurrence_set
 
+        ## self.include_completed should default to False if todo is explicity set,
+        ## otherwise True
+        if self.include_completed is None:
+            self.include_completed = not self.todo
+
+        ## Component type flags are a bit difficult.  In the CalDAV library,
+        ## if all of them are None, everything should be returned.  If only
+        ## one of them is True, then only this kind of component type is
+        ## returned.  In any other case, no guarantees of correctness are given.
+
+        ## Let's skip the last remark and try to make a generic and
+        ## correct solution from the start: 1) if any flags are True,
+        ## then consider flags set as None as False.  2) if any flags
+        ## are still None, then consider those to be True.  3) List
+        ## the flags that are True as acceptable component types:
+
+        todo, event, journal = self.todo, self.event, self.journal
+        unset_default = not (todo or event or journal)
+        if todo is None:
+            todo = self.todo = unset_default
+        if event is None:
+            event = self.event = unset_default
+        if journal is None:
+            journal = self.journal = unset_default
+
+        comptypesu = frozenset(
+            name
+            for name, flag in (("VTODO", todo), ("VEVENT", event), ("VJOURNAL", journal))
+            if flag
+        )
+
         ## Ensure timezone is set.  Ensure start and end are datetime objects.
         for attr in ("start", "end", "alarm_start", "alarm_end"):
             value = getattr(self, attr)
@@ -357,6 +468,34 @@ class Searcher(FilterMixin):
                     )
                 setattr(self, attr, _normalize_dt(value))
 
+        ## Only filter on the component type if some flag was explicitly
+        ## requested - otherwise everything (i.e. VFREEBUSY) passes
+        check_comptype = not (todo and event and journal)
+
+        ## Nothing of the wanted component types - no need to check
+        ## the base element or expand anything
+        if (
+            not expand_only
+            and check_comptype
+            and not any(x.name in comptypesu for x in orig_recurrence_set)
+        ):
+            return False if self.expand else None
+
+        ## An alarm search can only match components having alarms.
+        ## Expanded occurrences carry the alarms of the component they
+        ## were expanded from, so if nothing in the recurrence set has a
+        ## VALARM there is no need to expand it and check every
+        ## occurrence.
+        if (
+            not expand_only
+            and not _ignore_rrule_and_time
+            and (self.alarm_start or self.alarm_end)
+            and not any(
+                x.name == "VALARM" for comp in orig_recurrence_set for x in comp.subcomponents
+            )
+        ):
+            return False if self.expand else None
+
         ## recurrence_set is our internal generator/iterator containing
         ## everything that hasn't been filtered out yet (in most
         ## cases, the generator will yield either one or zero
@@ -407,73 +546,81 @@ class Searcher(FilterMixin):
                 ## filtering out occurrences with properties added by expansion.
                 skip_undef_for_expanded = True
 
-        ## self.include_completed should default to False if todo is explicity set,
-        ## otherwise True
-        if self.include_completed is None:
-            self.include_completed = not self.todo
-
-        ## Component type flags are a bit difficult.  In the CalDAV library,
-        ## if all of them are None, everything should be returned.  If only
-        ## one of them is True, then only this kind of component type is
-        ## returned.  In any other case, no guarantees of correctness are given.
-
-        ## Let's skip the last remark and try to make a generic and
-        ## correct solution from the start: 1) if any flags are True,
-        ## then consider flags set as None as False.  2) if any flags
-        ## are still None, then consider those to be True.  3) List
-        ## the flags that are True as acceptable component types:
-
-        comptypesl = ("todo", "event", "journal")
-        if any(getattr(self, x) for x in comptypesl):
-            for x in comptypesl:
-                if getattr(self, x) is None:
-                    setattr(self, x, False)
-        else:
-            for x in comptypesl:
-                if getattr(self, x) is None:
-                    setattr(self, x, True)
-
-        comptypesu = set([f"V{x.upper()}" for x in comptypesl if getattr(self, x)])
-
         ## if expand_only, expand all comptypes, otherwise only the comptypes specified in the filters
         comptypes_for_expansion = ["VTODO", "VEVENT", "VJOURNAL"] if expand_only else comptypesu
 
         if not _ignore_rrule_and_time and "RRULE" in first:
-            recurrence_set = self._expand_recurrences(recurrence_set, comptypes_for_expansion)
+            if (
+                not expand_only
+                and (self.start or self.end)
+                and not self._recurrence_set_could_overlap(recurrence_set)
+            ):
+                ## No occurrence can fall within the time range, no need to expand
+                return False if self.expand else None
+            recurrence_set = self._expand_recurrences(
+                recurrence_set,
+                comptypes_for_expansion,
+                for_alarm_search=not expand_only and bool(self.alarm_start or self.alarm_end),
+            )
 
         if not expand_only:
-            ## OPTIMIZATION TODO: If the object was recurring, we should
-            ## probably trust recur.between to do the right thing?
-            if not _ignore_rrule_and_time and (self.start or self.end):
-                recurrence_set = (x for x in recurrence_set if self._check_range(x))
-
-            ## This if is just to save some few CPU cycles - skip filtering if it's not needed
-            if not all(getattr(self, x) for x in comptypesl):
-                recurrence_set = (x for x in recurrence_set if x.name in comptypesu)
-
-            ## Filter based on include_completed setting
-            recurrence_set = (x for x in recurrence_set if self._check_completed_filter(x))
-
-            ## Apply property filters
-            if self._property_filters or self._property_operator:
-                recurrence_set = (
-                    x
-                    for x in recurrence_set
-                    if self._check_property_filters(x, skip_undef=skip_undef_for_expanded)
-                )
-
-            ## Apply alarm filters
-            if not _ignore_rrule_and_time and (self.alarm_start or self.alarm_end):
-                recurrence_set = (x for x in recurrence_set if self._check_alarm_range(x))
-
+            ## All the filters needed are applied by one predicate.  The
+            ## checks are ordered cheapest first, so the more expensive
+            ## checks only see components passing the cheap ones
+            ## The flags and the bound check methods are looked up once
+            ## here rather than for every (expanded) component
+            check_completed = not self.include_completed
+            check_properties = bool(self._property_filters or self._property_operator)
+            check_range = not _ignore_rrule_and_time and bool(self.start or self.end)
+            check_alarms = not _ignore_rrule_and_time and bool(self.alarm_start or self.alarm_end)
+            completed_filter = self._check_completed_filter
+            property_filters = self._check_property_filters
+            range_filter = self._check_range
+            alarm_filter = self._check_alarm_range
+
+            def passes(x: Component) -> bool:
+                ## This if is just to save some few CPU cycles - skip filtering if it's not needed
+                if check_comptype and x.name not in comptypesu:
+                    return False
+
+                ## Filter based on include_completed setting
+                if check_completed and not completed_filter(x):
+                    return False
+
+                ## Apply property filters
+                if check_properties and not property_filters(x, skip_undef=skip_undef_for_expanded):
+                    return False
+
+                if not (check_range or check_alarms):
+                    return True
+
+                ## Both the range and the alarm checks need the
+                ## normalized start and end, find them once
+                start_end = _start_end(x)
+
+                ## OPTIMIZATION TODO: If the object was recurring, we should
+                ## probably trust recur.between to do the right thing?
+                if check_range and not range_filter(x, start_end):
+                    return False
+
+                ## Apply alarm filters
+                return not check_alarms or alarm_filter(x, start_end)
+
+            recurrence_set = filter(passes, recurrence_set)
+
+        ## Pull the first match through the pipeline to find out if
+        ## there is any match at all.  When expanding, the match is put
+        ## back in front of the remaining (still lazy) recurrences
+        ## rather than tee-ing the generator, which would buffer
+        ## everything yielded by it.
+        recurrence_set = iter(recurrence_set)
+        first_match = next(recurrence_set, _MISSING)
+        if first_match is _MISSING:
+            return False if self.expand else None
         if self.expand:
             ## TODO: fix wrapping, if needed
-            return _iterable_or_false(recurrence_set)
-        else:
-            if next(recurrence_set, None):
-                return orig_recurrence_set
-            else:
-                return None
+            return chain((first_match,), recurrence_set)
+        return orig_recurrence_set
 
     def filter(
         self, components: list[Calendar | Component], split_expanded: bool = False
@@ -512,7 +659,10 @@ class Searcher(FilterMixin):
 
                 if split_expanded and len(matched_list) > 1:
                     # Split expanded recurrences into separate Calendar objects
-                    # Each recurrence becomes its own Calendar
+                    # Each recurrence becomes its own Calendar.  The timezones
+                    # to preserve are the same for all of them
+                    if isinstance(component, Calendar):
+                        timezones = _split_timezones(component)[0]
                     for comp in matched_list:
                         if isinstance(comp, Timezone):
                             continue
@@ -526,9 +676,6 @@ class Searcher(FilterMixin):
                                 new_cal[key] = value
 
                             # Preserve timezone components
-                            timezones = [
-                                tz for tz in component.subcomponents if isinstance(tz, Timezone)
-                            ]
                             for tz in timezones:
                                 from copy import deepcopy
 
@@ -548,10 +695,7 @@ class Searcher(FilterMixin):
                             new_cal[key] = value
 
                         # Preserve timezone components
-                        timezones = [
-                            tz for tz in component.subcomponents if isinstance(tz, Timezone)
-                        ]
-                        for tz in timezones:
+                        for tz in _split_timezones(component)[0]:
                             from copy import deepcopy
 
                             new_cal.add_component(deepcopy(tz))
@@ -590,10 +734,7 @@ class Searcher(FilterMixin):
         from copy import deepcopy
 
         # Separate timezone components from other components
-        timezones = [comp for comp in calendar.subcomponents if isinstance(comp, Timezone)]
-        other_components = [
-            comp for comp in calendar.subcomponents if not isinstance(comp, Timezone)
-        ]
+        timezones, other_components = _split_timezones(calendar)
 
         # Filter each component
         matching_components = []
@@ -645,7 +786,8 @@ class Searcher(FilterMixin):
             sorted_events = searcher.sort(events)  # Returns new sorted list
         """
         if self._sort_keys:
-            return sorted(components, key=self.sorting_value)
+            now = _normalize_dt(datetime.now())
+            return sorted(components, key=lambda x: self.sorting_value(x, now))
         else:
             return components.copy()
 
@@ -670,15 +812,11 @@ class Searcher(FilterMixin):
             return deepcopy(calendar)
 
         # Separate timezone components from other components
-        from icalendar import Timezone
-
-        timezones = [comp for comp in calendar.subcomponents if isinstance(comp, Timezone)]
-        other_components = [
-            comp for comp in calendar.subcomponents if not isinstance(comp, Timezone)
-        ]
+        timezones, other_components = _split_timezones(calendar)
 
         # Sort the non-timezone components
-        sorted_components = sorted(other_components, key=self.sorting_value)
+        now = _normalize_dt(datetime.now())
+        sorted_components = sorted(other_components, key=lambda x: self.sorting_value(x, now))
 
         # Create new calendar with sorted components
         from copy import deepcopy
@@ -699,12 +837,22 @@ class Searcher(FilterMixin):
 
         return new_calendar
 
-    def sorting_value(self, component: Component | CalendarObjectResource) -> tuple:
+    def sorting_value(
+        self, component: Component | CalendarObjectResource, _now: datetime | None = None
+    ) -> tuple:
         """Returns a sortable value from the component, based on the sort keys
 
         The component may be an icalendar.Calendar, an
         icalendar.Component (i.e. icalendar.Event) or an
         caldav.CalendarObjectResource (i.e. caldav.Event).
+
+        The values are comparable tokens rather than display values:
+        text with a collation given is turned into byte string sort
+        keys, and timestamps into POSIX timestamps.
+
+        :param _now: Internal - the normalized wall clock, for the "isnt_overdue" and "hasnt_started"
+            keys.  Passed by :meth:`sort` so all components are
+            compared against the same time.
         """
         ret = []
         ## TODO: this logic has been moved more or less as-is from the
@@ -713,40 +861,19 @@ class Searcher(FilterMixin):
         ## TODO: we disregard any complexity wrg of recurring events
         component = self._unwrap(component)
         if isinstance(component, Calendar):
-            not_tz_components = (x for x in component.subcomponents if not isinstance(x, Timezone))
-            comp = next(not_tz_components)
+            comp = _first_non_tz(component)
         else:
             comp = component
 
-        defaults = {
-            ## TODO: all possible non-string sort attributes needs to be listed here, otherwise we will get type errors when comparing objects with the property defined vs undefined (or maybe we should make an "undefined" object that always will compare below any other type?  Perhaps there exists such an object already?)
-            "due": "2050-01-01",
-            "dtstart": "1970-01-01",
-            "priority": 0,
-            "status": {
-                "VTODO": "NEEDS-ACTION",
-                "VJOURNAL": "FINAL",
-                "VEVENT": "TENTATIVE",
-            }[comp.name],
-            "category": "",
-            ## Usage of strftime is a simple way to ensure there won't be
-            ## problems if comparing dates with timestamps
-            "isnt_overdue": not (
-                "due" in comp
-                and comp["due"].dt.strftime("%F%H%M%S") < datetime.now().strftime("%F%H%M%S")
-            ),
-            "hasnt_started": (
-                "dtstart" in comp
-                and comp["dtstart"].dt.strftime("%F%H%M%S") > datetime.now().strftime("%F%H%M%S")
-            ),
-        }
+        if _now is None:
+            _now = _normalize_dt(datetime.now())
         for sort_key, reverse in self._sort_keys:
             if sort_key == "categories":
                 val = comp.categories
             else:
                 val = comp.get(sort_key, None)
             if val is None:
-                ret.append(defaults.get(sort_key, ""))
+                ret.append(_sort_default(comp, sort_key, _now))
                 continue
 
             # Track if this is a text property (for collation)
@@ -755,8 +882,10 @@ class Searcher(FilterMixin):
 
             if hasattr(val, "dt"):
                 val = val.dt
-            if hasattr(val, "strftime"):
-                val = val.strftime("%F%H%M%S")
+            if isinstance(val, date):
+                ## Dates and timestamps, with or without time zone, are
+                ## all comparable after normalization
+                val = _normalize_dt(val).timestamp()
 
             ## TODO: I don't have time to fix test code for this at
             ## the moment (but the bug in v1.0.0 was caught by cyrus
@@ -780,17 +909,20 @@ class Searcher(FilterMixin):
 
             # Apply collation only to text properties (not datetime strings)
             if is_text_property and isinstance(val, str):
-                collation = self._sort_collation[sort_key]
-                locale = self._sort_locale.get(sort_key)
-                case_sensitive = self._sort_case_sensitive.get(sort_key, True)
-                sort_key_fn = get_sort_key_function(collation, case_sensitive, locale)
+                sort_key_fn = self._sort_key_functions.get(sort_key)
+                if sort_key_fn is None:
+                    collation = self._sort_collation[sort_key]
+                    locale = self._sort_locale.get(sort_key)
+                    case_sensitive = self._sort_case_sensitive.get(sort_key, True)
+                    sort_key_fn = get_sort_key_function(collation, case_sensitive, locale)
+                    self._sort_key_functions[sort_key] = sort_key_fn
                 val = sort_key_fn(val)
 
             if reverse:
                 if isinstance(val, (str, bytes)):
                     if isinstance(val, str):
                         val = val.encode()
-                    val = bytes(b ^ 0xFF for b in val)
+                    val = val.translate(_INVERT_TABLE)
                 else:
                     val = -val
             ret.append(val)
@@ -853,33 +985,43 @@ class Searcher(FilterMixin):
         ## We shouldn't get here.  There should always be a valid component.
         if not len(components):
             raise ValueError("Empty component?")
+        if len(components) == 1:
+            return components
         first = components[0]
 
+        ## Check all the exception recurrences in one go
+        valid_recurrences = True
+        same_uid = True
+        first_uid = first["uid"]
+        for x in components[1:]:
+            if "RECURRENCE-ID" not in x or "RRULE" in x:
+                valid_recurrences = False
+            if x.get("uid") != first_uid:
+                same_uid = False
+
         ## A recurrence set should always be one "master" with
         ## rrule-id set, followed by zero or more objects without
         ## rrule-id but with recurrence-id set
-        if len(components) > 1:
-            if (
-                ("RRULE" not in components[0] and "RECURRENCE-ID" not in components[0])
-                or not all("recurrence-id" in x for x in components[1:])
-                or any("RRULE" in x for x in components[1:])
-            ):
-                raise ValueError(
-                    "Expected a valid recurrence set, either with one master component followed with special recurrences or with only occurrences"
-                )
+        if not valid_recurrences or ("RRULE" not in first and "RECURRENCE-ID" not in first):
+            raise ValueError(
+                "Expected a valid recurrence set, either with one master component followed with special recurrences or with only occurrences"
+            )
 
         ## components should typically be a list with only one component.
         ## if there are more components, it should be a recurrence set
         ## one of the things identifying a recurrence set is that the
         ## uid is the same for all components in the set
-        if any(x for x in components if x["uid"] != first["uid"]):
+        if not same_uid:
             raise ValueError(
                 "Input parameter component is supposed to contain a single component or a recurrence set - but multiple UIDs found"
             )
         return components
 
     def _expand_recurrences(
-        self, recurrence_set: list[Component], comptypesu: set[str]
+        self,
+        recurrence_set: list[Component],
+        comptypesu: Collection[str],
+        for_alarm_search: bool = False,
     ) -> Iterable[Component]:
         """Expand recurring events within the searcher's time range.
 
@@ -889,6 +1031,7 @@ class Searcher(FilterMixin):
 
         :param recurrence_set: List of calendar components to expand
         :param comptypesu: Set of component type strings (e.g., {"VEVENT", "VTODO"})
+        :param for_alarm_search: Skip occurrences whose alarms can't fire within the alarm range
         :return: Iterable of expanded component instances
         """
         cal = Calendar()
@@ -897,7 +1040,17 @@ class Searcher(FilterMixin):
         recur = recurring_ical_events.of(cal, components=comptypesu)
 
         # Use local variables for start/end to avoid modifying searcher state
-        start = self.start if self.start else _normalize_dt(DATE_MIN_DT)
-        end = self.end if self.end else _normalize_dt(DATE_MAX_DT)
+        start = self.start if self.start else DATE_MIN_NORMALIZED
+        end = self.end if self.end else DATE_MAX_NORMALIZED
+
+        ## An alarm search without (or with a wide) time range would
+        ## otherwise expand occurrences far outside the alarm range
+        if for_alarm_search:
+            window = self._alarm_expansion_window(recurrence_set)
+            if window is not None:
+                start = max(start, window[0])
+                end = min(end, window[1])
+                if start >= end:
+                    return iter(())
 
         return recur.between(start, end)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from datetime import date, datetime
-from itertools import tee
+from datetime import date, datetime, time
+from itertools import chain
 
 from icalendar.prop import TypesFactory
+from recurring_ical_events import DATE_MAX_DT, DATE_MIN_DT
 
 ## We need an instance of the icalendar.prop.TypesFactory class.
 ## We'll make a global instance rather than instantiate it for
@@ -17,20 +18,32 @@ types_factory = TypesFactory()
 ## Helper to normalize date/datetime for comparison
 ## (I feel this one is duplicated over many projects ...)
 def _normalize_dt(dt_value: date | datetime) -> datetime:
-    """Convert date to datetime for comparison, or return datetime as-is with timezone."""
-    if dt_value is None:
-        return None
-    ## If it's a date (not datetime), convert to datetime at midnight
-    if hasattr(dt_value, "year") and not hasattr(dt_value, "hour"):
-        from datetime import time
+    """Convert date to datetime for comparison, or return datetime as-is with timezone.
 
+    ``dt_value`` must not be None; callers check for missing values first.
+    """
+    ## If it's a date (not datetime), convert to datetime at midnight.
+    ## (datetime is a subclass of date, hence the check for datetime)
+    if not isinstance(dt_value, datetime):
         return datetime.combine(dt_value, time.min).astimezone()
+    ## Aware datetimes compare correctly regardless of their time zone,
+    ## so there is no need to convert those
+    if dt_value.tzinfo is not None:
+        return dt_value
     ## TODO: we should probably do some research on the default calendar timezone,
     ## which may not be the same as the local timezone ... uh ... timezones are
     ## difficult.
+    ## Naive datetimes are still localized with astimezone() rather than a
+    ## cached tzinfo, as the local UTC offset depends on the date (DST)
     return dt_value.astimezone()
 
 
+## The open ends of a time range, normalized once rather than for every
+## component without timestamps or every expansion without start/end
+DATE_MIN_NORMALIZED = _normalize_dt(DATE_MIN_DT)
+DATE_MAX_NORMALIZED = _normalize_dt(DATE_MAX_DT)
+
+
 ## Helper - generators are generally more neat than lists,
 ## but bool(x) will always return True.  I'd like to verify
 ## that a generator is not empty, without side effects.
@@ -40,19 +53,18 @@ def _iterable_or_false(g: Iterable, _debug_print_peek: bool = False) -> bool | I
     `next`).  It will then return a new iterator that behaves like
     the original iterator (like if `next` wasn't used).
 
-    Uses itertools.tee to create two independent iterators: one for
-    checking if the iterator is empty, and one to return.
+    The item taken out is chained in front of the rest of the
+    iterator, which is cheaper than a tee when peeking at one item.
+    Anything not being an iterator (lists, ranges, ...) is treated as
+    a container and simply tested for truthiness.
     """
     if not isinstance(g, Iterator):
         return bool(g) and g
 
-    # Create two independent iterators from the input
-    check_it, result_it = tee(g)
-
     try:
-        my_value = next(check_it)
-        if _debug_print_peek:
-            print(my_value)
-        return result_it  # Return the untouched iterator
+        my_value = next(g)
     except StopIteration:
         return False
+    if _debug_print_peek:
+        print(my_value)
+    return chain((my_value,), g)
@@ -5,11 +5,14 @@ Tests the alarm_start and alarm_end parameters for finding events/todos
 with alarms that trigger within a specific time range.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
+import pytest
 from icalendar import Alarm, Calendar, Event, Todo
 
 from icalendar_searcher import Searcher
+from icalendar_searcher.filters import _repeats_in_range
 
 
 def test_event_with_alarm_relative_trigger() -> None:
@@ -401,3 +404,74 @@ def test_todo_alarm_no_dtstart_no_due() -> None:
     )
     result = searcher.check_component(cal)
     assert result, "Todo with absolute alarm trigger should match"
+
+
+def test_recurring_event_without_alarms_not_expanded() -> None:
+    """A recurring event without alarms should not be expanded for an alarm search."""
+    cal = Calendar()
+    event = Event()
+    event.add("uid", "recurring-no-alarm")
+    event.add("dtstart", datetime(2025, 1, 15, 10, 0))
+    event.add("dtend", datetime(2025, 1, 15, 11, 0))
+    event.add("rrule", {"freq": "daily"})
+    cal.add_component(event)
+
+    searcher = Searcher(
+        event=True,
+        alarm_start=datetime(2025, 1, 15, 9, 40),
+        alarm_end=datetime(2025, 1, 15, 9, 50),
+    )
+    with patch.object(Searcher, "_expand_recurrences", side_effect=AssertionError("expanded")):
+        assert not searcher.check_component(cal)
+
+    searcher.expand = True
+    assert not searcher.check_component(cal)
+
+
+def test_alarm_search_expands_only_near_alarm_range() -> None:
+    """An alarm search on an endless recurring event should only expand the
+    occurrences whose alarms may fire within the alarm range."""
+    cal = Calendar()
+    event = Event()
+    event.add("uid", "endless-with-alarm")
+    event.add("dtstart", datetime(2025, 1, 15, 10, 0))
+    event.add("dtend", datetime(2025, 1, 15, 11, 0))
+    event.add("rrule", {"freq": "daily"})
+    alarm = Alarm()
+    alarm.add("action", "DISPLAY")
+    alarm.add("trigger", timedelta(minutes=-15), parameters={"RELATED": "END"})
+    event.add_component(alarm)
+    cal.add_component(event)
+
+    searcher = Searcher(
+        event=True,
+        expand=True,
+        alarm_start=datetime(2025, 3, 10, 10, 40),
+        alarm_end=datetime(2025, 3, 10, 10, 50),
+    )
+    ## Without a time range, all occurrences until 2038 would be expanded
+    occurrences = list(searcher.check_component(cal))
+    assert [x.start for x in occurrences] == [datetime(2025, 3, 10, 10, 0)]
+
+
+## The alarm fires at 09:00 and is repeated every 5 minutes; with
+## REPEAT=3 the repetitions are at 09:05, 09:10 and 09:15
+@pytest.mark.parametrize(
+    ("duration", "repeat_count", "lo", "hi", "expected"),
+    [
+        pytest.param(5, 3, (9, 4), (9, 6), True, id="in_range"),
+        pytest.param(5, 3, (8, 0), (8, 30), False, id="before"),
+        pytest.param(5, 3, (9, 16), (10, 0), False, id="after"),
+        pytest.param(5, 3, (9, 6), (9, 9), False, id="between_repetitions"),
+        pytest.param(-5, 3, (8, 49), (8, 51), True, id="negative_duration"),
+        pytest.param(5, 0, (9, 4), (9, 6), False, id="repeat_zero"),
+        pytest.param(5, 3, (9, 11), (9, 15), False, id="range_end_exclusive"),
+    ],
+)
+def test_repeats_in_range(
+    duration: int, repeat_count: int, lo: tuple, hi: tuple, expected: bool
+) -> None:
+    first = datetime(2025, 1, 15, 9, 0, tzinfo=timezone.utc)
+    lo = first.replace(hour=lo[0], minute=lo[1])
+    hi = first.replace(hour=hi[0], minute=hi[1])
+    assert _repeats_in_range(first, timedelta(minutes=duration), repeat_count, lo, hi) == expected
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 import pytest
-from icalendar import Calendar, Event, Todo
+from icalendar import Calendar, Event, FreeBusy, Todo
 
 from icalendar_searcher import Searcher
 from icalendar_searcher.utils import _iterable_or_false
@@ -68,6 +68,22 @@ def test_filter_component_types() -> None:
         assert searcher.check_component(cal)
 
 
+def test_other_component_type_without_type_flags() -> None:
+    """With no type flags set, components other than VTODO, VEVENT and
+    VJOURNAL should not be filtered out"""
+    cal = Calendar()
+    comp = FreeBusy()
+    comp["uid"] = "someuid"
+    cal.add_component(comp)
+    assert Searcher().check_component(cal) == [comp]
+    assert not Searcher(event=True).check_component(cal)
+
+    searcher = Searcher()
+    searcher.add_property_filter("UID", "someuid", operator="==")
+    assert searcher.check_component(cal) == [comp]
+    assert searcher.todo and searcher.event and searcher.journal
+
+
 ## _iterable_or_false() was defined to support return values evaluating into False,
 ## but still support generators
 def test_iterable_or_false() -> None:
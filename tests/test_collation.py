@@ -6,7 +6,13 @@ import pytest
 from icalendar import Event, Todo
 
 from icalendar_searcher import Collation, Searcher
-from icalendar_searcher.collation import HAS_PYICU, CollationError
+from icalendar_searcher.collation import (
+    HAS_PYICU,
+    CollationError,
+    _get_icu_contains,
+    contains_batch,
+    get_collation_function,
+)
 
 
 def test_case_sensitive_search_default() -> None:
@@ -132,6 +138,35 @@ def test_case_insensitive_categories() -> None:
     assert result, "Case-insensitive category search should match 'work' in 'Work'"
 
 
+def test_case_insensitive_multiple_categories() -> None:
+    """Case-insensitive subset and set equality for several categories."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("categories", ["Work", "Important", "Project"])
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter(
+        "CATEGORIES", "work,IMPORTANT", operator="contains", case_sensitive=False
+    )
+    assert searcher.check_component(event), "Subset check should ignore case"
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter("CATEGORIES", "work,IMPORTANT", operator="contains")
+    assert not searcher.check_component(event), "Subset check should be case-sensitive"
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter(
+        "CATEGORIES", "project,work,IMPORTANT", operator="==", case_sensitive=False
+    )
+    assert searcher.check_component(event), "Set equality should ignore case"
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter(
+        "CATEGORIES", "work,IMPORTANT", operator="==", case_sensitive=False
+    )
+    assert not searcher.check_component(event), "Set equality requires all categories"
+
+
 def test_collation_power_user_api_binary() -> None:
     """Power users can explicitly specify SIMPLE collation with case_sensitive=True."""
     event = Event()
@@ -241,6 +276,38 @@ def test_collation_with_todo() -> None:
     assert result, "Case-insensitive search should work with VTODO"
 
 
+def test_icu_contains_normalizes_combining_characters() -> None:
+    """Precomposed and decomposed accents should be found in each other."""
+    precomposed = "Caf\u00e9 du Monde"
+    decomposed = "Cafe\u0301 du Monde"
+    for case_sensitive in (True, False):
+        contains = _get_icu_contains(None, case_sensitive)
+        assert contains("Caf\u00e9", decomposed)
+        assert contains("Cafe\u0301", precomposed)
+        ## The accent is significant, "Cafe" should not match in the middle of "Café"
+        assert not contains("Cafe", precomposed)
+        assert not contains("Cafe", decomposed)
+    assert _get_icu_contains(None, False)("CAF\u00c9", decomposed)
+    assert not _get_icu_contains(None, True)("CAF\u00c9", decomposed)
+
+
+@pytest.mark.parametrize("case_sensitive", [True, False])
+def test_contains_batch_matches_collation_function(case_sensitive: bool) -> None:
+    """contains_batch should give the same answers as the single-string matcher."""
+    haystacks = ["Training Session", "TRAIN", "Weekly meeting", "", "Træning"]
+    match_fn = get_collation_function(Collation.SIMPLE, case_sensitive)
+    for needle in ("train", "Train", "æ", ""):
+        expected = [match_fn(needle, h) for h in haystacks]
+        assert contains_batch(needle, haystacks, case_sensitive=case_sensitive) == expected
+
+
+@patch("icalendar_searcher.collation.HAS_PYICU", False)
+def test_contains_batch_requires_pyicu_for_unicode() -> None:
+    """contains_batch should raise CollationError like get_collation_function."""
+    with pytest.raises(CollationError):
+        contains_batch("test", ["Test"], collation=Collation.UNICODE)
+
+
 @pytest.mark.skipif(not HAS_PYICU, reason="PyICU not installed")
 def test_pyicu_unicode_collation_with_pyicu() -> None:
     """UNICODE collation should work when PyICU is installed."""
@@ -3,9 +3,13 @@ Automated tests for property filtering functionality.
 Tests the _check_property_filters method and property filtering in check_component.
 """
 
+import pytest
 from icalendar import Event, Todo
+from icalendar.prop import vCategory
 
-from icalendar_searcher import Searcher
+from icalendar_searcher import Collation, Searcher
+from icalendar_searcher.collation import HAS_PYICU
+from icalendar_searcher.filters import _normalize_categories_filter
 
 
 def test_property_filter_contains_match() -> None:
@@ -47,6 +51,25 @@ def test_property_filter_contains_case_insensitive() -> None:
     assert result, "Contains filter with case_sensitive=False should be case-insensitive"
 
 
+def test_category_contains_case_insensitive() -> None:
+    """'category' with 'contains' and case_sensitive=False matches substrings of any case."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("categories", ["Outdoor", "WORK"])
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter("category", "doo", operator="contains", case_sensitive=False)
+    assert searcher.check_component(event)
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter("category", "wOr", operator="contains", case_sensitive=False)
+    assert searcher.check_component(event)
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter("category", "home", operator="contains", case_sensitive=False)
+    assert not searcher.check_component(event)
+
+
 def test_property_filter_contains_missing_property() -> None:
     """Property filter should not match if property is missing."""
     event = Event()
@@ -216,3 +239,98 @@ def test_check_property_filters_no_filters() -> None:
 
     # No filters added
     assert searcher._check_property_filters(event), "Should match when no filters set"
+
+
+def test_property_filter_replaced_after_use() -> None:
+    """Replacing a filter on the same property should take effect, also after
+    the old filter has been used."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("summary", "Training session")
+
+    searcher = Searcher()
+    searcher.add_property_filter("SUMMARY", "rain", operator="contains")
+    assert searcher.check_component(event)
+
+    searcher.add_property_filter("SUMMARY", "TRAIN", operator="contains")
+    assert not searcher.check_component(event)
+
+    searcher.add_property_filter("SUMMARY", "TRAIN", operator="contains", case_sensitive=False)
+    assert searcher.check_component(event)
+
+
+def test_category_filter_does_not_short_circuit_other_filters() -> None:
+    """A matching category filter must not skip the filters added after it."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("summary", "Team meeting")
+    event.add("categories", ["Work"])
+
+    for key, operator in (
+        ("categories", "=="),
+        ("categories", "contains"),
+        ("category", "=="),
+        ("category", "contains"),
+        ("uid", "=="),
+    ):
+        value = "123" if key == "uid" else "Work"
+        searcher = Searcher()
+        searcher.add_property_filter(key, value, operator=operator)
+        assert searcher.check_component(event)
+
+        searcher.add_property_filter("SUMMARY", "Training", operator="contains")
+        assert not searcher.check_component(event), (
+            f"SUMMARY filter should be applied after a matching {key} {operator} filter"
+        )
+
+
+@pytest.mark.parametrize(
+    ("filter_value", "expected"),
+    [
+        (vCategory(["work"]), "work"),
+        (vCategory(["work,home"]), frozenset({"work", "home"})),
+        (vCategory(["work", "home"]), frozenset({"work", "home"})),
+        ("work", "work"),
+        ("work,home", frozenset({"work", "home"})),
+        (["work", "home,family"], frozenset({"work", "home", "family"})),
+    ],
+)
+def test_normalize_categories_filter(filter_value: object, expected: object) -> None:
+    """Categories filter values should be one name or a frozenset of names."""
+    assert _normalize_categories_filter(filter_value) == expected
+
+
+def test_property_filters_checked_cheapest_first() -> None:
+    """Undef and equality filters should be checked before substring filters."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("summary", "Training session")
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter("SUMMARY", "rain", operator="contains")
+    searcher.add_property_filter("UID", "123", operator="==")
+    searcher.add_property_filter("LOCATION", None, operator="undef")
+
+    assert searcher.check_component(event)
+    assert list(searcher._compiled_filters) == ["location", "uid", "summary"]
+
+    searcher.add_property_filter("UID", "456", operator="==")
+    assert not searcher.check_component(event)
+
+
+@pytest.mark.skipif(not HAS_PYICU, reason="PyICU not installed")
+def test_collation_filters_checked_after_simple_filters() -> None:
+    """UNICODE collation filters should be checked after SIMPLE substring filters."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("summary", "Training session")
+    event.add("location", "Room 5")
+
+    searcher = Searcher(event=True)
+    searcher.add_property_filter(
+        "SUMMARY", "TRAINING", collation=Collation.UNICODE, case_sensitive=False
+    )
+    searcher.add_property_filter("LOCATION", "Room", operator="contains")
+
+    assert searcher.check_component(event)
+    assert list(searcher._compiled_filters) == ["location", "summary"]
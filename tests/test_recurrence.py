@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 from icalendar import Calendar, Event
 from icalendar.prop import vRecur
@@ -238,3 +239,72 @@ def test_recurrence_exception_modified_summary_not_match_wrong_range() -> None:
     assert not searcher.check_component(cal), (
         "Should not match when exception is outside date range"
     )
+
+
+def test_recurrence_outside_range_not_expanded() -> None:
+    """A recurring event ending before, or starting after, the range should not be expanded."""
+    cal = Calendar()
+    event = Event()
+    event.add("uid", "daily-january")
+    event.add("dtstart", datetime(2025, 1, 1, 10, 0))
+    event.add("dtend", datetime(2025, 1, 1, 11, 0))
+    event.add("rrule", vRecur(FREQ="DAILY", UNTIL=datetime(2025, 1, 31, 10, 0)))
+    cal.add_component(event)
+
+    for start, end in (
+        (datetime(2025, 3, 1), datetime(2025, 3, 2)),
+        (datetime(2024, 12, 1), datetime(2024, 12, 2)),
+    ):
+        searcher = Searcher(event=True, start=start, end=end)
+        with patch.object(Searcher, "_expand_recurrences", side_effect=AssertionError("expanded")):
+            assert not searcher.check_component(cal)
+
+    searcher = Searcher(event=True, start=datetime(2025, 1, 31), end=datetime(2025, 2, 1))
+    assert searcher.check_component(cal)
+    searcher = Searcher(event=True, start=datetime(2025, 2, 1), end=datetime(2025, 2, 2))
+    assert not searcher.check_component(cal)
+
+
+def test_recurrence_with_count_outside_range_not_expanded() -> None:
+    """A recurring event whose COUNT ends before the range should not be expanded."""
+    cal = Calendar.from_ical(
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\n"
+        "UID:weekly-count\r\n"
+        "DTSTART:20250101T100000Z\r\n"
+        "DTEND:20250101T110000Z\r\n"
+        "RRULE:FREQ=WEEKLY;INTERVAL=2;COUNT=3\r\n"
+        "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+    utc = timezone.utc
+
+    searcher = Searcher(
+        event=True, start=datetime(2025, 3, 1, tzinfo=utc), end=datetime(2025, 3, 2, tzinfo=utc)
+    )
+    with patch.object(Searcher, "_expand_recurrences", side_effect=AssertionError("expanded")):
+        assert not searcher.check_component(cal)
+
+    ## The last occurrence is on 2025-01-29
+    searcher = Searcher(
+        event=True, start=datetime(2025, 1, 29, tzinfo=utc), end=datetime(2025, 1, 30, tzinfo=utc)
+    )
+    assert searcher.check_component(cal)
+    searcher = Searcher(
+        event=True, start=datetime(2025, 1, 30, tzinfo=utc), end=datetime(2025, 1, 31, tzinfo=utc)
+    )
+    assert not searcher.check_component(cal)
+
+
+def test_recurrence_of_other_component_type_not_expanded() -> None:
+    """A recurring event should not be expanded when only tasks are searched for."""
+    cal = Calendar()
+    event = Event()
+    event.add("uid", "daily-event")
+    event.add("dtstart", datetime(2025, 1, 1, 10, 0))
+    event.add("rrule", vRecur(FREQ="DAILY"))
+    cal.add_component(event)
+
+    searcher = Searcher(todo=True, start=datetime(2025, 1, 1), end=datetime(2026, 1, 1))
+    with patch.object(Searcher, "_expand_recurrences", side_effect=AssertionError("expanded")):
+        assert not searcher.check_component(cal)
@@ -1,4 +1,5 @@
 import pytest
+from icalendar import Event
 
 from icalendar_searcher import Searcher
 
@@ -37,3 +38,32 @@ def test_add_sort_key_special() -> None:
     s = Searcher()
     s.add_sort_key("isnt_overdue", reversed=True)
     assert ("isnt_overdue", True) in s._sort_keys
+
+
+def test_compiled_filters_not_compared() -> None:
+    """Compiling the property filters should not make otherwise equal
+    searchers compare unequal."""
+    s1 = Searcher(event=True)
+    s2 = Searcher(event=True)
+    for s in (s1, s2):
+        s.add_property_filter("summary", "rain", operator="contains")
+    s1._compile_property_filters()
+    assert s1._compiled_filters
+    assert s1 == s2
+    assert repr(s1) == repr(s2)
+
+
+def test_sort_key_functions_not_compared() -> None:
+    """Looking up the sort key functions should not make otherwise
+    equal searchers compare unequal."""
+    event = Event()
+    event.add("uid", "123")
+    event.add("summary", "rain")
+    s1 = Searcher()
+    s2 = Searcher()
+    for s in (s1, s2):
+        s.add_sort_key("summary")
+    s1.sorting_value(event)
+    assert s1._sort_key_functions
+    assert s1 == s2
+    assert repr(s1) == repr(s2)
@@ -6,7 +6,7 @@ Tests that the sort() method correctly sorts different types of inputs:
 - List of CalendarObjectResource objects (caldav)
 """
 
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 
 from icalendar import Calendar, Event, Todo
 
@@ -400,3 +400,24 @@ def test_sort_calendar_no_sort_keys() -> None:
     # Should have same content
     assert len(result.subcomponents) == len(cal.subcomponents)
     assert result["PRODID"] == cal["PRODID"]
+
+
+def test_sort_mixed_dates_and_time_zones() -> None:
+    """Dates, floating and zoned timestamps should sort on the actual point in time."""
+    tz_plus_2 = timezone(timedelta(hours=2))
+    early = Event()
+    early.add("uid", "early")
+    early.add("dtstart", datetime(2025, 1, 15, 11, 0, tzinfo=tz_plus_2))  # 09:00 UTC
+    late = Event()
+    late.add("uid", "late")
+    late.add("dtstart", datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc))
+    allday = Event()
+    allday.add("uid", "allday")
+    allday.add("dtstart", date(2025, 1, 10))
+    undated = Todo()
+    undated.add("uid", "undated")
+
+    searcher = Searcher()
+    searcher.add_sort_key("DTSTART")
+    sorted_uids = [str(x["uid"]) for x in searcher.sort([late, undated, early, allday])]
+    assert sorted_uids == ["undated", "allday", "early", "late"]
@@ -28,7 +28,7 @@ from icalendar_searcher import Searcher
 ## 2) the icalendar.Event object directly, without being part of an
 ## icalendar (this probably breaks now, but it should be acceptable)
 def test_sorting_value_mixed_types_and_reverse() -> None:
-    """Check dtstart -> strftime, priority numeric, reversed summary -> bytes-inverted,
+    """Check dtstart -> timestamp, priority numeric, reversed summary -> bytes-inverted,
     and categories -> joined string."""
     cal = Calendar()
     ev = Event()
@@ -46,7 +46,7 @@ def test_sorting_value_mixed_types_and_reverse() -> None:
 
     vals = s.sorting_value(cal)
 
-    assert vals[0] == "2025-01-02090000"
+    assert vals[0] == real_datetime(2025, 1, 2, 9, 0).timestamp()
     assert vals[1] == 5
     assert vals[2] == bytes(b ^ 0xFF for b in b"abc")
     assert vals[3] == "x,y"
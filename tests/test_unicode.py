@@ -183,6 +183,18 @@ class TestTurkishCharacters:
         searcher.add_property_filter("SUMMARY", "GÜMÜŞHANE", operator="==", case_sensitive=False)
         assert searcher.check_component(cal)
 
+    def test_turkish_contains_case_insensitive(self) -> None:
+        """Case-insensitive contains folds non-ASCII letters, but locale independently."""
+        cal = make_event("Gümüşhane ırmak")
+        searcher = Searcher()
+        searcher.add_property_filter("SUMMARY", "GÜMÜŞ", operator="contains", case_sensitive=False)
+        assert searcher.check_component(cal)
+
+        ## Without a Turkish locale, "I" folds to "i" and not to dotless "ı"
+        searcher = Searcher()
+        searcher.add_property_filter("SUMMARY", "IRMAK", operator="contains", case_sensitive=False)
+        assert not searcher.check_component(cal)
+
     def test_turkish_cedilla_matching(self) -> None:
         """Test Turkish ç character matching."""
         cal = make_event("Çocuk")
@@ -402,6 +414,14 @@ class TestMixedScriptsAndCollations:
         assert searcher_ci.check_component(cal_lower)
         assert searcher_ci.check_component(cal_upper)
 
+    def test_case_insensitive_uses_case_folding(self) -> None:
+        """Case-insensitive SIMPLE matching should fold "ß" to "ss"."""
+        cal = make_event("Straße")
+        for operator, search in (("==", "STRASSE"), ("contains", "STRASS")):
+            searcher = Searcher()
+            searcher.add_property_filter("SUMMARY", search, operator=operator, case_sensitive=False)
+            assert searcher.check_component(cal)
+
     def test_emoji_and_special_unicode(self) -> None:
         """Test handling of emoji and special Unicode characters."""
         cal = make_event("Party 🎉 Celebration")